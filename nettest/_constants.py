@@ -0,0 +1,26 @@
+"""
+
+@author: Aymen Brahim Djelloul
+@version : 0.1
+@date : 22.07.2025
+@license : MIT License
+
+
+"""
+
+# IMPORTS
+import sys
+
+
+# Define global variables
+VERSION: str = "0.1"
+TIMEOUT: int = 5
+
+# sys.platform is a C-level constant, so these flags cost nothing to
+# compute and nothing to test — unlike substring checks against
+# platform.platform(), which execs uname / reads the registry on first
+# call and is case-inconsistent to match against
+_OS: str = sys.platform
+_IS_LINUX: bool = _OS.startswith("linux")
+_IS_WIN: bool = _OS == "win32"
+_IS_MAC: bool = _OS == "darwin"
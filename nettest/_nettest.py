@@ -0,0 +1,968 @@
+"""
+
+@author: Aymen Brahim Djelloul
+@version : 0.1
+@date : 22.07.2025
+@license : MIT License
+
+
+"""
+
+# IMPORTS
+import os
+import re
+import sys
+import asyncio
+import time
+import socket
+import struct
+import subprocess
+import traceback
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from ._constants import TIMEOUT, _IS_LINUX, _IS_WIN, _IS_MAC
+from ._types import TestResult
+
+# Deferred: importing requests drags in the whole urllib3/SSL machinery,
+# which `nettest --version` and `--help` never need
+requests = None
+HTTPAdapter = None
+Retry = None
+
+
+def _import_requests() -> None:
+    """ This function imports requests lazily, on first NetTest construction"""
+    global requests, HTTPAdapter, Retry
+
+    if requests is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+try:
+    # Optional: a netlink query is roughly 20x cheaper than forking `ip`
+    from pyroute2 import IPRoute
+    _HAS_PYROUTE2: bool = True
+
+except ImportError:
+    _HAS_PYROUTE2: bool = False
+
+
+# Precompiled patterns for parsing subprocess output; bytes patterns so
+# the raw stdout never needs to be utf-8 decoded as a whole
+_IFCONFIG_RE = re.compile(rb'inet (?:addr:)?(\d+\.\d+\.\d+\.\d+)')
+_DEV_RE = re.compile(rb'dev\s+(\w+)')
+
+
+if _IS_WIN:
+    import ctypes
+
+    # From ipifcons.h / iptypes.h
+    _IF_TYPE_ETHERNET: int = 6
+    _IF_TYPE_IEEE80211: int = 71
+    _IF_OPER_STATUS_UP: int = 1
+    _GAA_FLAG_INCLUDE_GATEWAYS: int = 0x0080
+    _ERROR_BUFFER_OVERFLOW: int = 111
+
+    class _IpAdapterAddresses(ctypes.Structure):
+        """ Trimmed IP_ADAPTER_ADDRESSES layout; pointers we never walk stay void"""
+
+    _IpAdapterAddresses._fields_ = [
+        ("Length", ctypes.c_ulong),
+        ("IfIndex", ctypes.c_ulong),
+        ("Next", ctypes.POINTER(_IpAdapterAddresses)),
+        ("AdapterName", ctypes.c_char_p),
+        ("FirstUnicastAddress", ctypes.c_void_p),
+        ("FirstAnycastAddress", ctypes.c_void_p),
+        ("FirstMulticastAddress", ctypes.c_void_p),
+        ("FirstDnsServerAddress", ctypes.c_void_p),
+        ("DnsSuffix", ctypes.c_wchar_p),
+        ("Description", ctypes.c_wchar_p),
+        ("FriendlyName", ctypes.c_wchar_p),
+        ("PhysicalAddress", ctypes.c_ubyte * 8),
+        ("PhysicalAddressLength", ctypes.c_ulong),
+        ("Flags", ctypes.c_ulong),
+        ("Mtu", ctypes.c_ulong),
+        ("IfType", ctypes.c_ulong),
+        ("OperStatus", ctypes.c_int),
+        ("Ipv6IfIndex", ctypes.c_ulong),
+        ("ZoneIndices", ctypes.c_ulong * 16),
+        ("FirstPrefix", ctypes.c_void_p),
+        ("TransmitLinkSpeed", ctypes.c_uint64),
+        ("ReceiveLinkSpeed", ctypes.c_uint64),
+        ("FirstWinsServerAddress", ctypes.c_void_p),
+        ("FirstGatewayAddress", ctypes.c_void_p),
+    ]
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """ This function computes the RFC 1071 ones-complement checksum of an ICMP packet"""
+
+    if len(data) % 2:
+        data += b'\x00'
+
+    total = sum(int.from_bytes(data[i:i + 2], 'big') for i in range(0, len(data), 2))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+class NetTest(object):
+    """
+    A network testing utility class that provides methods to gather network information.
+
+    This class includes functionality to:
+    - Get the public IP address
+    - Get the local gateway IP address
+    - Get ISP information
+    - Validate IP addresses
+    - Perform basic network connectivity tests
+
+    Example usage:
+        >>> tester = NetTest()
+        >>> public_ip = tester.get_public_ip()
+        >>> gateway_ip = tester.get_gateway_ip()
+        >>> isp_info = tester.get_isp_info()
+
+    Note: Some methods require internet connectivity and may raise exceptions if
+    network services are unavailable.
+    """
+
+    _PUBLIC_IP_API: str = "https://api.ipify.org"
+
+    # Speed-test endpoints and tuning: several parallel streams so slow
+    # start does not dominate, and a warmup window that is discarded
+    _SPEED_DOWN_URL: str = "https://speed.cloudflare.com/__down?bytes=100000000"
+    _SPEED_UP_URL: str = "https://speed.cloudflare.com/__up"
+    _BANDWIDTH_STREAMS: int = 4
+    _BANDWIDTH_DURATION: float = 10.0
+    _BANDWIDTH_WARMUP: float = 2.0
+
+    # How long a cached probe result stays valid (seconds)
+    _CACHE_TTL: float = 2.0
+
+    def __init__(self, dev_mode: bool = False) -> None:
+
+        # Pull in requests now that network work is actually coming
+        _import_requests()
+
+        # Define developer mode
+        self._dev_mode = dev_mode
+
+        # Define requests session with an explicitly-sized connection pool
+        # and retries, so repeated API calls reuse one kept-alive TLS
+        # connection instead of renegotiating a handshake each time
+        self._r_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+        )
+        self._r_session.mount("http://", adapter)
+        self._r_session.mount("https://", adapter)
+        self._r_session.headers["Connection"] = "keep-alive"
+
+        # Define empty variables for caching
+        self._public_ip: Optional[str] = None
+        self._local_ip: Optional[str] = None
+        self._ipinfo_cache: Optional[dict] = None
+
+        # Persistent UDP socket reused by measure_network_latency
+        self._latency_sock: Optional[socket.socket] = None
+
+        # TTL caches holding (monotonic timestamp, value) so that
+        # back-to-back probes don't repeat the same TCP handshake
+        self._conn_cache: Optional[tuple] = None
+        self._ping_cache: Optional[tuple] = None
+
+        # Pre-resolve the probe endpoints once; libc does not cache
+        # lookups between calls, so every probe would otherwise hit the
+        # system resolver again
+        self._addr_cache: dict = {}
+        for host, port in (("8.8.8.8", 53), ("api.ipify.org", 443), ("ipinfo.io", 443)):
+            try:
+                info = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_STREAM)
+                self._addr_cache[(host, port)] = info[0][4]
+            except socket.gaierror:
+                pass
+
+    def invalidate(self) -> None:
+        """ This method will clear cached probe results to force fresh measurements"""
+        self._conn_cache = None
+        self._ping_cache = None
+        self._ipinfo_cache = None
+        self._public_ip = None
+        self._local_ip = None
+        self._close_latency_sock()
+
+    def is_connected(self, timeout: float = 3.0, host: str = "8.8.8.8", port: int = 53) -> bool:
+        """
+        Checks internet connectivity by attempting a socket connection.
+
+        Args:
+            timeout (float): Socket timeout in seconds.
+            Host (str): Remote host to test (default: Google DNS).
+            Port (int): Port to connect to (default: 53).
+
+        Returns:
+            bool: True if connected, False otherwise.
+        """
+
+        # Return the cached result while it is still fresh
+        if self._conn_cache and time.monotonic() - self._conn_cache[0] < self._CACHE_TTL:
+            return self._conn_cache[1]
+
+        try:
+            socket.setdefaulttimeout(timeout)
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.connect(self._addr_cache.get((host, port), (host, port)))
+            sock.close()
+
+            self._conn_cache = (time.monotonic(), True)
+            return True
+
+        except Exception as e:
+            if self._dev_mode:
+                # Log full traceback instead of just printing
+                traceback.print_exc()  # Detailed error in dev
+
+            self._conn_cache = (time.monotonic(), False)
+            return False
+
+    def _netlink_default_route(self) -> tuple:
+        """
+        Queries the default IPv4 route over netlink (Linux only).
+        Runs fully in-process, without the fork()+exec() cost of spawning `ip`.
+
+        Returns:
+            tuple: (gateway_ip, interface_name), either may be None
+        """
+
+        if not _HAS_PYROUTE2:
+            return None, None
+
+        try:
+            with IPRoute() as ipr:
+                for route in ipr.get_default_routes(family=socket.AF_INET):
+                    gateway = route.get_attr('RTA_GATEWAY')
+                    oif = route.get_attr('RTA_OIF')
+
+                    ifname = None
+                    if oif is not None:
+                        links = ipr.get_links(oif)
+                        if links:
+                            ifname = links[0].get_attr('IFLA_IFNAME')
+
+                    return gateway, ifname
+
+        except Exception:
+            if self._dev_mode:
+                traceback.print_exc()
+
+        return None, None
+
+    def get_gateway_ip(self) -> str:
+        """
+        Returns the default gateway IP address with optimized performance.
+        Fast platform-specific detection with minimal overhead.
+
+        Returns:
+            str: The gateway IP address or "Unknown" if detection fails
+        """
+
+        try:
+            if _IS_LINUX:
+                # Fastest: in-process netlink query (no subprocess)
+                gateway, _ = self._netlink_default_route()
+                if gateway:
+                    return gateway
+
+                # Next best: Direct /proc/net/route parsing.
+                # The file is a few KB at most, so one raw read() plus a
+                # bytes split beats per-line text decoding; the kernel
+                # writes the default route among the first rows.
+                try:
+                    with open('/proc/net/route', 'rb') as f:
+                        data = f.read()
+
+                    for line in data.split(b'\n')[1:]:  # Skip header
+                        fields = line.split()
+                        if len(fields) > 2 and fields[1] == b'00000000':  # Default route
+                            gateway_hex = fields[2]
+                            if gateway_hex != b'00000000':
+                                # Gateway is a hex-encoded little-endian u32
+                                return socket.inet_ntoa(bytes.fromhex(gateway_hex.decode())[::-1])
+
+                except (IOError, ValueError):
+                    pass
+
+                # Fallback: ip route (faster than route -n)
+                result = subprocess.run(
+                    ["ip", "r", "s", "0/0"], capture_output=True, text=True, timeout=2
+                )
+                for line in result.stdout.split('\n'):
+                    if "via" in line:
+                        parts = line.split()
+                        via_idx = next((i for i, x in enumerate(parts) if x == "via"), -1)
+                        if via_idx != -1 and via_idx + 1 < len(parts):
+                            return parts[via_idx + 1]
+
+            elif _IS_WIN:
+                # Fast route command with specific target
+                result = subprocess.run(
+                    ["route", "print", "-4", "0.0.0.0"], capture_output=True, text=True, timeout=2
+                )
+                for line in result.stdout.split('\n'):
+                    if "0.0.0.0" in line:
+                        parts = line.split()
+                        if len(parts) >= 3 and parts[0] == "0.0.0.0" and parts[1] == "0.0.0.0":
+                            gateway = parts[2]
+                            if gateway != "On-link":
+                                return gateway
+
+            elif _IS_MAC:  # macOS
+                result = subprocess.run(
+                    ["route", "-n", "get", "0.0.0.0"], capture_output=True, text=True, timeout=2
+                )
+                for line in result.stdout.split('\n'):
+                    line = line.strip()
+                    if line.startswith("gateway:"):
+                        return line.split(":")[1].strip()
+
+        except (subprocess.SubprocessError, subprocess.TimeoutExpired, FileNotFoundError):
+            pass
+
+        # Ultra-fast fallback: Derive from local IP
+        local_ip = self._get_local_ip()
+        if local_ip:
+            # Most common gateway pattern
+            parts = local_ip.split('.')
+            if len(parts) == 4:
+                return f"{parts[0]}.{parts[1]}.{parts[2]}.1"
+
+        return "n/a"
+
+    def _get_local_ip(self) -> Optional[str]:
+        """
+        Resolves the machine's primary source IP with a single UDP connect.
+
+        connect() on a UDP socket sends no packet — the kernel only makes
+        a routing decision and binds the source address — so no timeout or
+        reachable host is needed and the answer is immediate. The result
+        is memoized on the instance.
+
+        Returns:
+            Optional[str]: The source IP address, or None if it cannot be determined
+        """
+
+        if self._local_ip:
+            return self._local_ip
+
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.connect(('10.255.255.255', 1))
+                ip = s.getsockname()[0]
+
+            if ip and not ip.startswith(('127.', '169.254.')):
+                self._local_ip = ip
+                return ip
+
+        except socket.error:
+            pass
+
+        return None
+
+    def get_machine_ip(self) -> str:
+        """
+        Returns the machine's primary IP address (not loopback).
+        Uses multiple fallback methods for maximum reliability.
+        Works on Windows, Linux, and macOS.
+
+        Returns:
+            str: The primary IP address or "Unknown" if detection fails
+        """
+
+        # Method 1: Socket routing decision (most reliable)
+        ip = self._get_local_ip()
+        if ip:
+            return ip
+
+        # Method 2: Platform-specific system commands
+        try:
+            if _IS_WIN:
+                result = subprocess.run(
+                    ["ipconfig"], capture_output=True, text=True, timeout=5
+                )
+                for line in result.stdout.split('\n'):
+                    if "IPv4 Address" in line and ":" in line:
+                        ip = line.split(":")[-1].strip()
+                        if ip and not ip.startswith(('127.', '169.254.')):
+                            return ip
+
+            else:  # Linux/macOS
+                for cmd in [["hostname", "-I"], ["ifconfig"], ["ip", "addr", "show"]]:
+                    try:
+                        result = subprocess.run(cmd, capture_output=True, timeout=5)
+
+                        if cmd[0] == "hostname":
+                            # hostname -I returns space-separated IPs
+                            ips = result.stdout.split()
+                        else:
+                            # Parse ifconfig/ip output
+                            ips = _IFCONFIG_RE.findall(result.stdout)
+
+                        for ip in ips:
+                            ip = ip.decode()
+                            if ip and not ip.startswith(('127.', '169.254.')):
+                                return ip
+
+                    except (subprocess.SubprocessError, FileNotFoundError):
+                        continue
+
+        except Exception:
+            pass
+
+        return "n/a"
+
+    def _win_interface_type(self) -> Optional[str]:
+        """
+        Classifies the active Windows interface with GetAdaptersAddresses.
+
+        Walks the adapter list for the first one that is up and has a
+        gateway, then reads its IfType directly — no subprocess and no
+        dependence on netsh's localized output.
+
+        Returns:
+            Optional[str]: 'Wi-Fi', 'Ethernet', or None if the call fails
+        """
+
+        if not _IS_WIN:
+            return None
+
+        try:
+            size = ctypes.c_ulong(15 * 1024)
+
+            for _ in range(2):
+                buf = ctypes.create_string_buffer(size.value)
+                ret = ctypes.windll.iphlpapi.GetAdaptersAddresses(
+                    socket.AF_UNSPEC,
+                    _GAA_FLAG_INCLUDE_GATEWAYS,
+                    None,
+                    ctypes.cast(buf, ctypes.POINTER(_IpAdapterAddresses)),
+                    ctypes.byref(size)
+                )
+                if ret != _ERROR_BUFFER_OVERFLOW:
+                    break
+
+            if ret != 0:
+                return None
+
+            adapter = ctypes.cast(buf, ctypes.POINTER(_IpAdapterAddresses))
+            while adapter:
+                entry = adapter.contents
+
+                if entry.OperStatus == _IF_OPER_STATUS_UP and entry.FirstGatewayAddress:
+                    if entry.IfType == _IF_TYPE_IEEE80211:
+                        return "Wi-Fi"
+                    if entry.IfType == _IF_TYPE_ETHERNET:
+                        return "Ethernet"
+
+                adapter = entry.Next
+
+        except (OSError, AttributeError):
+            if self._dev_mode:
+                traceback.print_exc()
+
+        return None
+
+    def get_interface_type(self) -> str:
+        """
+        Detects whether the primary network interface is Wi-Fi or Ethernet.
+        Returns:
+            str: 'Wi-Fi', 'Ethernet', or 'Unknown'
+        """
+
+        try:
+            if _IS_WIN:
+                # Windows detection: one iphlpapi call, no subprocess and
+                # no localization-fragile output parsing
+                iface_type = self._win_interface_type()
+                if iface_type is not None:
+                    return iface_type
+
+                # Fallback: netsh (only reliable on English locales)
+                result = subprocess.run(
+                    ["netsh", "interface", "show", "interface"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    timeout=5
+                )
+                for line in result.stdout.splitlines():
+                    if "Connected" in line:
+                        if "Wi-Fi" in line:
+                            return "Wi-Fi"
+                        elif "Ethernet" in line:
+                            return "Ethernet"
+                return "Unknown"
+
+            elif _IS_LINUX:
+                # Linux detection: resolve the default interface over
+                # netlink first, fall back to parsing `ip route`
+                _, interface = self._netlink_default_route()
+
+                if interface is None:
+                    route_result = subprocess.run(
+                        ["ip", "route", "show", "default"],
+                        capture_output=True,
+                        check=True,
+                        timeout=2
+                    )
+                    match = _DEV_RE.search(route_result.stdout)
+                    if not match:
+                        return "Unknown"
+                    interface = match.group(1).decode()
+
+                wireless_path = f"/sys/class/net/{interface}/wireless"
+                if os.path.exists(wireless_path):
+                    return "Wi-Fi"
+                return "Ethernet"
+
+            elif _IS_MAC:  # macOS
+                # macOS detection
+                service_result = subprocess.run(
+                    ["networksetup", "-listallhardwareports"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    timeout=5
+                )
+                for line in service_result.stdout.splitlines():
+                    if "Device: " in line:
+                        interface = line.split(": ")[1].strip()
+                        if "en" in interface:
+                            if "AirPort" in service_result.stdout:
+                                return "Wi-Fi"
+                            return "Ethernet"
+                return "Unknown"
+
+            else:
+                return "Unknown"
+
+        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
+            return "Unknown"
+
+    # Minimal DNS query (ID, RD flag, one question: root NS IN) used as
+    # the payload for the UDP latency probe
+    _DNS_PROBE_QUERY: bytes = (b'\x12\x34\x01\x00\x00\x01\x00\x00\x00\x00\x00\x00'
+                               b'\x00\x00\x02\x00\x01')
+
+    def measure_network_latency(self) -> float:
+        """ This method will get the network latency measure in cross-platform
+
+        Sends a minimal DNS query over a persistent UDP socket and times
+        the reply. UDP needs no handshake and the socket is created once
+        and reused, so repeated measurements cost one round-trip each
+        instead of connection setup plus round-trip.
+
+        Returns:
+            float: Round-trip latency in milliseconds, or float('inf') when offline
+        """
+
+        try:
+            sock = self._latency_sock
+            if sock is None:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                sock.settimeout(2)
+                sock.connect(self._addr_cache.get(("8.8.8.8", 53), ("8.8.8.8", 53)))
+                self._latency_sock = sock
+
+            start = time.perf_counter()
+            sock.send(self._DNS_PROBE_QUERY)
+            sock.recv(512)
+            end = time.perf_counter()
+
+            return (end - start) * 1000.0
+
+        except socket.error:
+            # Drop the broken socket so the next call starts clean
+            self._close_latency_sock()
+            return float('inf')
+
+    def _close_latency_sock(self) -> None:
+        """ This method closes the persistent latency socket if it is open"""
+        if self._latency_sock is not None:
+            try:
+                self._latency_sock.close()
+            except (OSError, AttributeError):
+                pass
+            self._latency_sock = None
+
+    def _icmp_ping(self, host: str, timeout: float) -> Optional[int]:
+        """
+        Measure a single-RTT ICMP echo round-trip, like the system ping tool.
+
+        Raw sockets need CAP_NET_RAW (or Administrator on Windows), so this
+        quietly returns None when that privilege is missing and the caller
+        falls back to the TCP handshake measurement.
+
+        Returns:
+            Optional[int]: Round-trip time in milliseconds, or None on failure
+        """
+
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+        except OSError:
+            # No raw-socket privilege
+            return None
+
+        try:
+            with sock:
+                sock.settimeout(timeout)
+
+                # Echo request: type 8, code 0, checksum, identifier, sequence
+                ident = os.getpid() & 0xFFFF
+                header = struct.pack('!BBHHH', 8, 0, 0, ident, 1)
+                packet = struct.pack('!BBHHH', 8, 0, _icmp_checksum(header), ident, 1)
+
+                start = time.perf_counter()
+                sock.sendto(packet, (host, 0))
+
+                # A raw ICMP socket sees every inbound ICMP datagram on the
+                # host (other processes' replies, unreachables, redirects),
+                # so keep reading until our own echo reply or the deadline
+                deadline = start + timeout
+                while True:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        return None
+                    sock.settimeout(remaining)
+
+                    data = sock.recv(1024)
+                    end = time.perf_counter()
+
+                    # Reply arrives with its IP header; IHL gives the offset
+                    if len(data) < 20:
+                        continue
+                    ihl = (data[0] & 0x0F) * 4
+                    if len(data) < ihl + 8:
+                        continue
+
+                    r_type, r_code, _, r_ident, _ = struct.unpack(
+                        '!BBHHH', data[ihl:ihl + 8])
+
+                    # Only our own echo reply counts; anything else (another
+                    # process' traffic, an ICMP error) is not our RTT
+                    if r_type == 0 and r_code == 0 and r_ident == ident:
+                        return int((end - start) * 1000)
+
+        except (socket.timeout, socket.error):
+            return None
+
+    def measure_internet_ping(self) -> int:
+        """Measure approximate internet ping in milliseconds using a TCP handshake."""
+        host = "8.8.8.8"  # Google's DNS server
+        port = 53  # DNS service port
+        timeout = 2  # seconds
+
+        # Return the cached result while it is still fresh
+        if self._ping_cache and time.monotonic() - self._ping_cache[0] < self._CACHE_TTL:
+            return self._ping_cache[1]
+
+        # Preferred: raw ICMP echo, the true single-RTT measurement
+        ping_ms = self._icmp_ping(host, timeout)
+        if ping_ms is not None:
+            self._ping_cache = (time.monotonic(), ping_ms)
+            self._conn_cache = (time.monotonic(), True)
+            return ping_ms
+
+        try:
+            start = time.perf_counter()
+            with socket.create_connection(
+                    self._addr_cache.get((host, port), (host, port)), timeout=timeout):
+                end = time.perf_counter()
+            ping_ms = int((end - start) * 1000)  # convert to milliseconds
+
+            # A successful handshake also proves connectivity,
+            # so a following is_connected() costs zero syscalls
+            self._ping_cache = (time.monotonic(), ping_ms)
+            self._conn_cache = (time.monotonic(), True)
+            return ping_ms
+
+        except (socket.timeout, socket.error):
+            self._ping_cache = (time.monotonic(), -1)
+            return -1  # Indicates failure to connect
+
+    def _fetch_ipinfo(self) -> dict:
+        """
+        Fetch https://ipinfo.io/json once and cache the parsed payload.
+
+        The endpoint returns both the public IP and the ISP organisation,
+        so get_public_ip and get_isp_name share a single round-trip
+        instead of hitting two different APIs.
+
+        Returns:
+            dict: The parsed JSON payload, or an empty dict on failure.
+        """
+
+        # Check if the payload is cached
+        if self._ipinfo_cache is not None:
+            return self._ipinfo_cache
+
+        try:
+            response = self._r_session.get(
+                url="https://ipinfo.io/json",
+                timeout=TIMEOUT
+            )
+            response.raise_for_status()
+            self._ipinfo_cache = response.json()
+
+            # Cache the public ip while we have it
+            public_ip = self._ipinfo_cache.get("ip")
+            if public_ip and not self._public_ip:
+                self._public_ip = public_ip
+
+        except requests.exceptions.RequestException as e:
+            if self._dev_mode:
+                logging.error(f"ipinfo lookup failed: {str(e)}")
+            # Leave the cache empty on failure so the next call retries
+            # instead of serving the error for the rest of the session
+            return {}
+
+        return self._ipinfo_cache
+
+    def get_public_ip(self) -> str:
+        """Retrieve the public IP address in a cross-platform manner.
+
+        Returns:
+            str: The public IP address as a string, or "n/a" if the request fails.
+        """
+
+        # Check if the public ip address is cached
+        if self._public_ip:
+            return self._public_ip
+
+        # Primary source: the shared ipinfo payload
+        ip = self._fetch_ipinfo().get("ip")
+        if ip:
+            return ip
+
+        # Fallback: ipify, in case ipinfo.io is unreachable
+        try:
+            response = self._r_session.get(
+                url=self._PUBLIC_IP_API,
+                timeout=TIMEOUT
+            )
+
+            response.raise_for_status()         # Raise exception for HTTP errors
+            ip: str = response.text.strip()     # Remove any whitespace
+
+            # Cache the public ip
+            self._public_ip = ip
+            return ip
+
+        except requests.exceptions.RequestException as e:
+            if self._dev_mode:
+                traceback.print_exc()
+            return "n/a"
+
+    def get_isp_name(self) -> str:
+        """
+        Determine the Internet Service Provider (ISP) name for the current connection.
+
+        Returns:
+            str: The ISP name (e.g., "Telecom Algeria") if available, otherwise "n/a".
+        """
+
+        org = self._fetch_ipinfo().get("org")  # e.g., "AS36947 Telecom Algeria"
+
+        if org:
+            # Strip the AS number if present
+            return org.split(" ", 1)[1] if " " in org else org
+
+        return "n/a"
+
+    def _down_stream(self, deadline: float, warmup_end: float) -> int:
+        """ This method streams one chunked download until the deadline and counts post-warmup bytes"""
+
+        counted = 0
+        try:
+            while time.monotonic() < deadline:
+                with self._r_session.get(self._SPEED_DOWN_URL, stream=True, timeout=TIMEOUT) as response:
+                    response.raise_for_status()
+
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        now = time.monotonic()
+                        if now >= deadline:
+                            return counted
+                        if now >= warmup_end:
+                            counted += len(chunk)
+
+        except requests.exceptions.RequestException:
+            if self._dev_mode:
+                traceback.print_exc()
+
+        return counted
+
+    def _up_stream(self, deadline: float, warmup_end: float) -> int:
+        """ This method streams one chunked upload until the deadline and counts post-warmup bytes"""
+
+        counted = 0
+        chunk = b'\x00' * (64 * 1024)
+
+        def body():
+            nonlocal counted
+            while time.monotonic() < deadline:
+                if time.monotonic() >= warmup_end:
+                    counted += len(chunk)
+                yield chunk
+
+        try:
+            while time.monotonic() < deadline:
+                self._r_session.post(self._SPEED_UP_URL, data=body(), timeout=TIMEOUT)
+
+        except requests.exceptions.RequestException:
+            if self._dev_mode:
+                traceback.print_exc()
+
+        return counted
+
+    def _measure_bandwidth(self, stream_fn) -> Optional[float]:
+        """
+        Runs several parallel TCP streams against a speed endpoint and sums
+        their throughput.
+
+        A single TCP stream spends much of a short test in slow-start and
+        under-measures link capacity, so _BANDWIDTH_STREAMS streams run
+        concurrently for _BANDWIDTH_DURATION seconds and the first
+        _BANDWIDTH_WARMUP seconds of data are discarded.
+
+        Returns:
+            Optional[float]: Aggregate throughput in Mbps, or None on failure
+        """
+
+        start = time.monotonic()
+        warmup_end = start + self._BANDWIDTH_WARMUP
+        deadline = start + self._BANDWIDTH_DURATION
+
+        with ThreadPoolExecutor(max_workers=self._BANDWIDTH_STREAMS) as pool:
+            futs = [pool.submit(stream_fn, deadline, warmup_end)
+                    for _ in range(self._BANDWIDTH_STREAMS)]
+            total_bytes = sum(fut.result() for fut in futs)
+
+        if total_bytes <= 0:
+            return None
+
+        measured = self._BANDWIDTH_DURATION - self._BANDWIDTH_WARMUP
+        return (total_bytes * 8) / (measured * 1_000_000)
+
+    def measure_down_bandwidth(self, friendly: bool = False) -> Optional[float]:
+        """ This method will measure the download bandwidth speed in Mbps"""
+        mbps = self._measure_bandwidth(self._down_stream)
+        return round(mbps, 2) if friendly and mbps is not None else mbps
+
+    def measure_up_bandwidth(self, friendly: bool = False) -> Optional[float]:
+        """ This method will measure the upload bandwidth speed in Mbps"""
+        mbps = self._measure_bandwidth(self._up_stream)
+        return round(mbps, 2) if friendly and mbps is not None else mbps
+
+    def _quick_probes(self) -> dict:
+        """ This method maps each quick TestResult field to its probe"""
+        return {
+            "internet_connected": self.is_connected,
+            "interface_type": self.get_interface_type,
+            "gateway_ip": self.get_gateway_ip,
+            "machine_ip": self.get_machine_ip,
+            "network_latency": self.measure_network_latency,
+            "internet_ping": self.measure_internet_ping,
+
+            "public_ip": self.get_public_ip,
+            "isp": self.get_isp_name,
+        }
+
+    def _gather(self, probes: dict) -> TestResult:
+        """
+        Dispatches the given probes concurrently and collects them into a
+        TestResult.
+
+        Every probe is independent I/O (socket connect, HTTP round-trip or
+        subprocess), so the batch finishes in roughly the time of the
+        slowest probe instead of the sum of all of them, and the shared
+        session/resolver caches are amortized across the whole pass.
+        """
+
+        # Bandwidth probes legitimately run for the whole test duration,
+        # so they get a larger deadline than the quick probes
+        bandwidth_timeout = self._BANDWIDTH_DURATION + TIMEOUT
+
+        results: dict = {}
+        pool = ThreadPoolExecutor(max_workers=8)
+        futs = {name: pool.submit(fn) for name, fn in probes.items()}
+
+        for name, fut in futs.items():
+            try:
+                results[name] = fut.result(
+                    timeout=bandwidth_timeout if name.startswith("bandwidth") else TIMEOUT
+                )
+
+            except Exception:
+                # A single failed probe should not fail the whole test
+                if self._dev_mode:
+                    traceback.print_exc()
+
+                results[name] = None
+
+        # Abandon any probe that overran its deadline instead of joining
+        # it: shutdown(wait=True) would block until the straggler finally
+        # returned, which is exactly the stall the timeout exists to avoid
+        pool.shutdown(wait=False, cancel_futures=True)
+
+        return TestResult(success=True, **results)
+
+    def snapshot(self) -> TestResult:
+        """ This method gathers all quick probes in one concurrent batch
+
+        Same fan-out as run_test but without the long-running bandwidth
+        measurements, for callers that only need the instant picture of
+        the network.
+        """
+        return self._gather(self._quick_probes())
+
+    def run_test(self) -> TestResult:
+        """ This method will run the whole test and return the result"""
+
+        probes = self._quick_probes()
+        probes["bandwidth_down_mbps"] = lambda: self.measure_down_bandwidth(friendly=True)
+        probes["bandwidth_up_mbps"] = lambda: self.measure_up_bandwidth(friendly=True)
+
+        return self._gather(probes)
+
+    # Async facade -- thin awaitable wrappers over the sync probes, so an
+    # event-loop application can await NetTest without blocking the loop.
+    # The probes stay on the requests/socket stack the library already
+    # uses; asyncio.to_thread moves them off the loop thread and the
+    # ThreadPoolExecutor fan-out inside _gather keeps them overlapped.
+
+    async def aget_public_ip(self) -> Optional[str]:
+        """ Awaitable variant of get_public_ip"""
+        return await asyncio.to_thread(self.get_public_ip)
+
+    async def aget_isp_name(self) -> Optional[str]:
+        """ Awaitable variant of get_isp_name"""
+        return await asyncio.to_thread(self.get_isp_name)
+
+    async def asnapshot(self) -> TestResult:
+        """ Awaitable variant of snapshot"""
+        return await asyncio.to_thread(self.snapshot)
+
+    async def arun_test(self) -> TestResult:
+        """ Awaitable variant of run_test"""
+        return await asyncio.to_thread(self.run_test)
+
+    def __str__(self) -> str:
+        pass
+
+
+if __name__ == '__main__':
+    sys.exit(0)
